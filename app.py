@@ -6,7 +6,7 @@ import schedule
 import signal
 import sqlite3
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Custom Modules ---
 from guardian_scraper import GuardianScraper
@@ -18,6 +18,8 @@ NUM_SCRAPER_PAGES_INITIAL = int(os.environ.get('NUM_SCRAPER_PAGES_INITIAL', 100)
 NUM_SCRAPER_PAGES = int(os.environ.get('NUM_SCRAPER_PAGES', 1))
 MINUTES_BETWEEN_RUNS = int(os.environ.get('MINUTES_BETWEEN_RUNS', 60))
 FLASK_HOST = os.environ.get('FLASK_HOST', '127.0.0.1')
+SHUTDOWN_TIMEOUT_SECONDS = int(os.environ.get('SHUTDOWN_TIMEOUT_SECONDS', 60))
+SKIP_SCRAPED_ARTICLES = os.environ.get('SKIP_SCRAPED_ARTICLES', 'true').lower() == 'true'
 
 # --- Logging Configuration ---
 logging.basicConfig(
@@ -26,50 +28,87 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# --- Shutdown Event ---
+stop_event = threading.Event()  # Set on termination to wake up the scheduler loop and shut down.
+
+# --- Scraper Worker ---
+scraper_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scraper')  # Serializes database writes.
+scraper_lock = threading.Lock()  # Held while a scraper job is queued or running.
+
 
 def scraper_job(pages_to_scrape=NUM_SCRAPER_PAGES):
     """Scrape, load, and transform data"""
     logging.info("Starting the scraper job...")
     
-    # Scrape data first
-    logging.info("Starting task: Scraping data")
+    # Scrape data first, loading each batch as soon as it is scraped so that a failure does not lose it;
+    # rows landed by a failed run are transformed by the next one
+    logging.info("Starting task: Scraping and loading data")
     try:
-        scraper.scrape_data(page_count=pages_to_scrape)
-        if scraper.data is None:
-            raise ValueError("Scraped data is empty.")
-        logging.info("Completed task: Scraping data")
+        # Articles that are already stored are not fetched again, unless SKIP_SCRAPED_ARTICLES is disabled
+        skip_urls = database.get_scraped_urls() if SKIP_SCRAPED_ARTICLES else None
+        for batch in scraper.scrape_batches(page_count=pages_to_scrape, skip_urls=skip_urls):
+            database.load(dataframe=batch)
+
+            # Stop between batches when shutting down; the landed rows are transformed by the next run
+            if stop_event.is_set():
+                logging.warning("Shutdown requested, stopping the scraper job before transforming.")
+                return
+        logging.info("Completed task: Scraping and loading data")
     except Exception as e:
-        logging.error(f"Error during Scraping data: {e}")
+        logging.error(f"Error during Scraping and loading data: {e}")
         return
 
-    # Now, proceed to loading and transforming if data is available
-    tasks = [
-        ('Loading data', database.load, {'dataframe': scraper.data}),
-        ('Transforming data', database.transform, {})
-    ]
-
-    for task_name, task_func, task_args in tasks:
-        logging.info(f"Starting task: {task_name}")
-        try:
-            task_func(**task_args)
-            logging.info(f"Completed task: {task_name}")
-        except Exception as e:
-            logging.error(f"Error during {task_name}: {e}")
+    # Now, proceed to transforming the landed data
+    logging.info("Starting task: Transforming data")
+    try:
+        database.transform()
+        logging.info("Completed task: Transforming data")
+    except Exception as e:
+        logging.error(f"Error during Transforming data: {e}")
 
     logging.info("Finished the scraper job.")
 
 
+def enqueue_scraper_job(pages_to_scrape=NUM_SCRAPER_PAGES):
+    """Run the scraper job on the worker thread, skipping it if the previous run is still in progress"""
+    if not scraper_lock.acquire(blocking=False):
+        logging.warning("Previous scraper job is still running, skipping this run.")
+        return
+
+    future = scraper_executor.submit(scraper_job, pages_to_scrape=pages_to_scrape)
+    future.add_done_callback(lambda _: scraper_lock.release())
+
 
 def api_launch():
     """Launch the GuardianAPI for better concurrency"""
-    api.run(debug=False, threaded=True, host=FLASK_HOST)
+    try:
+        api.run(debug=False, threaded=True, host=FLASK_HOST)
+    except Exception as e:
+        logging.error(f"Error while running the API: {e}")
+    finally:
+        stop_event.set()  # The API was stopped (e.g. through /shutdown) or could not start, so shut down the rest as well.
 
 
 def handle_termination_signal(_, __):
     """Handle termination for a graceful shutdown"""
     logging.info('Shutting down gracefully...')
+    stop_event.set()  # The main loop wakes up and calls shutdown().
+
+
+def shutdown():
+    """Stop the API, let a running scraper job stop after its current batch, then flush and close the database"""
     api.stop()  # Using GuardianAPI's stop() function to stop the app.
-    exit(0)
+    api_thread.join()
+
+    # Drop queued scraper jobs and wait for the running one, if any, to stop after its current batch
+    scraper_executor.shutdown(wait=False, cancel_futures=True)
+    if not scraper_lock.acquire(timeout=SHUTDOWN_TIMEOUT_SECONDS):
+        logging.warning(f"Scraper job still running after {SHUTDOWN_TIMEOUT_SECONDS} seconds, forcing exit.")
+        os._exit(1)
+
+    database.close()  # Checkpoint the WAL and release the long-lived database connection.
+    scraper.close()  # Release the scraper's pooled HTTP connections.
+    logging.info('Shutdown complete.')
 
 
 # --- Main Execution ---
@@ -85,23 +124,29 @@ if __name__ == "__main__":
     logging.info("Database initialized!")
     database.initialize_database()
 
-    # Run the scraper job with more pages if no data exists, else use the regular number
+    # Queue the first scraper job, with more pages if no data exists, else use the regular number
     scraper = GuardianScraper()
     data_exists = database.has_data()
     pages_to_scrape = NUM_SCRAPER_PAGES_INITIAL if not data_exists else NUM_SCRAPER_PAGES
-    scraper_job(pages_to_scrape=pages_to_scrape)
+    enqueue_scraper_job(pages_to_scrape=pages_to_scrape)
 
     # Initialize GuardianAPI
     api = GuardianAPI()
 
     # Schedule scraper job runs
-    schedule.every(MINUTES_BETWEEN_RUNS).minutes.do(scraper_job)
+    schedule.every(MINUTES_BETWEEN_RUNS).minutes.do(enqueue_scraper_job)
 
     # Launch GuardianAPI concurrently
     api_thread = threading.Thread(target=api_launch)
     api_thread.start()
 
-    # Check scheduled tasks
-    while True:
+    # Sleep until the next scheduled task is due, instead of polling every second
+    while not stop_event.is_set():
+        idle_seconds = schedule.idle_seconds()
+        if idle_seconds is None:
+            break
+        if idle_seconds > 0 and stop_event.wait(timeout=idle_seconds):
+            break
         schedule.run_pending()
-        time.sleep(1)
\ No newline at end of file
+
+    shutdown()
\ No newline at end of file
@@ -1,12 +1,31 @@
 # Libraries
 import os
+import sys
+import json
+import time
+import queue
 import sqlite3
-from flask import Flask, request, jsonify
+import threading
+from flask import Flask, Response, request, jsonify
+from werkzeug.serving import make_server
 from datetime import date
+from guardian_database import GuardianDatabase
+
+# Constants
+DATABASE_URI = 'file:guardian_database.db?mode=ro'
+POOL_SIZE = 8
+CACHE_TTL_SECONDS = int(os.environ.get('CACHE_TTL_SECONDS', 3600))
+STREAM_THRESHOLD = 100
 
 class GuardianAPI:
-    def __init__(self):
+    def __init__(self, pool_size=POOL_SIZE):
         self.app = Flask(__name__)
+        self.__pool = queue.Queue(maxsize=pool_size)
+        self.__cache = {}
+        self.__cache_lock = threading.Lock()
+        self.__server = None
+        self.__server_lock = threading.Lock()
+        self.__stopping = False
         self.__setup_routes()
 
     def __setup_routes(self):
@@ -17,19 +36,113 @@ class GuardianAPI:
         self.app.add_url_rule('/top-authors', 'get_top_authors', self.__get_top_authors, methods=['GET'])
         self.app.add_url_rule('/shutdown', 'shutdown', self.__shutdown, methods=['POST'])
 
+    def __create_connection(self):
+        """Opens a long-lived, read-only connection to the database."""
+        connection = sqlite3.connect(DATABASE_URI, uri=True, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA query_only = 1;')
+        connection.execute('PRAGMA mmap_size = 268435456;')
+        connection.execute('PRAGMA cache_size = -65536;')
+        return connection
+
+    def __acquire_connection(self):
+        """Takes an idle connection from the pool, opening a new one if none is available."""
+        try:
+            return self.__pool.get_nowait()
+        except queue.Empty:
+            return self.__create_connection()
+
+    def __release_connection(self, connection):
+        """Returns a connection to the pool, closing it if the pool is already full."""
+        try:
+            self.__pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
     def __query_db(self, query, args=()):
         """Utility function to query the database and return rows."""
-        with sqlite3.connect('guardian_database.db') as connection:
-            cursor = connection.cursor()
-            result = cursor.execute(query, args)
-            columns = [column[0] for column in cursor.description]
-            return [dict(zip(columns, row)) for row in result.fetchall()]
+        connection = self.__acquire_connection()
+        try:
+            rows = connection.execute(query, args).fetchall()
+        finally:
+            self.__release_connection(connection)
+        return [dict(row) for row in rows]
+
+    def __stream_db(self, query, args, metadata):
+        """
+        Streams the rows of a paginated query as a JSON document, one row at a time,
+        so that large pages are never held in memory as a whole.
+        """
+        def generate():
+            # The connection is acquired once the generator runs: a generator closed before its first chunk
+            # never reaches the finally below, so acquiring it earlier would leak it from the pool
+            connection = None
+            try:
+                connection = self.__acquire_connection()
+                yield '{"items": ['
+                next_after_id = None
+                for index, row in enumerate(connection.execute(query, args)):
+                    item = dict(row)
+                    next_after_id = item['GuardianID']
+                    yield (',' if index else '') + json.dumps(item)
+                # Close the list, then append the page metadata (dropping the opening brace of its own object)
+                yield '],' + json.dumps({**metadata, 'next_after_id': next_after_id})[1:]
+            finally:
+                if connection is not None:
+                    self.__release_connection(connection)
+
+        return Response(generate(), mimetype='application/json')
+
+    def __respond_page(self, query, args, metadata):
+        """Runs a paginated query and returns it as JSON, streaming pages larger than STREAM_THRESHOLD."""
+        if metadata['per_page'] > STREAM_THRESHOLD:
+            return self.__stream_db(query, args, metadata)
+
+        items = self.__query_db(query, args)
+        next_after_id = items[-1]['GuardianID'] if items else None
+        return jsonify(**metadata, next_after_id=next_after_id, items=items)
+
+    def __query_db_cached(self, key, query, args=()):
+        """
+        Same as __query_db, but reuses the previous result for the given key until it is older
+        than CACHE_TTL_SECONDS or the database has been transformed since it was stored.
+        """
+        now = time.monotonic()
+        generation = GuardianDatabase.generation
+
+        with self.__cache_lock:
+            hit = self.__cache.get(key)
+        if hit and hit[1] == generation and now - hit[0] < CACHE_TTL_SECONDS:
+            return hit[2]
+
+        items = self.__query_db(query, args)
+        with self.__cache_lock:
+            self.__cache[key] = (now, generation, items)
+        return items
+
+    def __get_pagination(self):
+        """
+        Reads the pagination parameters of the current request.
+
+        Keyset pagination ('after_id') seeks straight to the requested rows. The 'page' parameter
+        is kept as a deprecated fallback and is translated into an OFFSET from the newest item.
+
+        Returns:
+        - tuple: (after_id, per_page, offset, metadata) where metadata describes the requested page.
+        """
+        # A non-positive per_page would become SQLite's unbounded 'LIMIT -1', so it is clamped to a single item
+        per_page = max(request.args.get('per_page', default=10, type=int), 1)
+        after_id = request.args.get('after_id', type=int)
+
+        if after_id is not None:
+            return after_id, per_page, 0, {'after_id': after_id, 'per_page': per_page}
+
+        page = max(request.args.get('page', default=1, type=int), 1)
+        return sys.maxsize, per_page, (page - 1) * per_page, {'current_page': page, 'per_page': per_page}
 
     def __get_items(self):
         """Endpoint to fetch a page of items."""
-        page = request.args.get('page', default=1, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
-        offset = (page - 1) * per_page
+        after_id, per_page, offset, metadata = self.__get_pagination()
 
         query = """
             SELECT
@@ -40,17 +153,15 @@ class GuardianAPI:
                 gua."Author"                AS Author,
                 gua."Text"                  AS TextContent
             FROM DTM_V_D_GUARDIAN AS gua
+            WHERE gua."ID Guardian" < ?
             ORDER BY gua."ID Guardian" DESC
             LIMIT ? OFFSET ?
         """
-        items = self.__query_db(query, (per_page, offset))
-        return jsonify(current_page=page, per_page=per_page, items=items)
+        return self.__respond_page(query, (after_id, per_page, offset), metadata)
 
     def __get_today(self):
         """Endpoint to fetch today's items."""
-        page = request.args.get('page', default=1, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
-        offset = (page - 1) * per_page
+        after_id, per_page, offset, metadata = self.__get_pagination()
 
         today_date = date.today().isoformat()
 
@@ -65,14 +176,13 @@ class GuardianAPI:
             FROM DTM_V_FT_GUARDIAN AS ft
             INNER JOIN DTM_V_D_GUARDIAN AS gua
                 ON ft."ID Guardian" = gua."ID Guardian"
-            INNER JOIN DTM_V_D_DATE AS dat
-                ON ft."ID Date" = dat."ID Date"
-            WHERE dat."ID Date" = ?
+            WHERE
+                ft."ID Date" = ?
+                AND gua."ID Guardian" < ?
             ORDER BY gua."ID Guardian" DESC
             LIMIT ? OFFSET ?
         """
-        items = self.__query_db(query, (today_date, per_page, offset))
-        return jsonify(current_page=page, per_page=per_page, items=items)
+        return self.__respond_page(query, (today_date, after_id, per_page, offset), metadata)
 
     def __get_last_article(self):
         """Endpoint to fetch the most recent article."""
@@ -85,9 +195,10 @@ class GuardianAPI:
                 ,gua."Author"                   AS Author
                 ,gua."Text"                     AS TextContent
             FROM DTM_V_D_GUARDIAN AS gua
-            WHERE gua."ID Guardian" = (SELECT MAX(g."ID Guardian") FROM DTM_V_D_GUARDIAN AS g)
+            ORDER BY gua."ID Guardian" DESC
+            LIMIT 1
         """
-        items = self.__query_db(query)
+        items = self.__query_db_cached('last', query)
         return jsonify(items[0] if items else {})
 
     def __get_top_authors(self):
@@ -101,7 +212,7 @@ class GuardianAPI:
             ORDER BY COUNT(gua."Author") DESC, gua."Author" ASC
             LIMIT 5;
         """
-        items = self.__query_db(query)
+        items = self.__query_db_cached('top-authors', query)
         return jsonify(items)
 
     def __shutdown(self):
@@ -110,18 +221,54 @@ class GuardianAPI:
         SECRET_KEY = "your_very_secret_key"  # Example secret key, use a more secure method in reality
         
         if self.app.debug and request.form.get('key') == SECRET_KEY:
-            os._exit(0)
+            # Stop from another thread so that this request can still be answered
+            threading.Thread(target=self.stop).start()
+            return "Shutting down", 200
             
         return "Unauthorized", 401
 
-    def run(self, debug=True, threaded=False, host='127.0.0.1'):
-        """Run the Flask application."""
-        self.app.run(debug=debug, threaded=threaded, host=host)
+    def run(self, debug=True, threaded=False, host='127.0.0.1', port=5000):
+        """
+        Run the Flask application until stop() is called.
+        Raises the error of the bind (e.g. the port is already in use) if the server cannot be started.
+        """
+        self.app.debug = debug
+
+        with self.__server_lock:
+            if self.__stopping:
+                return
+            try:
+                self.__server = make_server(host, port, self.app, threaded=threaded)
+            except (OSError, SystemExit) as e:
+                # There is no server to stop, so a later stop() only has to close the pooled connections
+                self.__stopping = True
+                # Werkzeug reports a failed bind with sys.exit(), which would silently end the calling thread
+                raise OSError(f"Could not start the server on {host}:{port}") from e
+
+        try:
+            self.__server.serve_forever()
+        finally:
+            # Release the listening socket once the server has stopped
+            self.__server.server_close()
 
     
     def stop(self):
-        """Stop the Flask application."""
-        os._exit(0)
+        """
+        Stop the Flask application from accepting new requests and close the pooled connections.
+        Requests that are still being handled are not waited for: the threaded server runs them on daemon threads.
+        """
+        with self.__server_lock:
+            self.__stopping = True
+            server = self.__server
+
+        if server is not None:
+            server.shutdown()
+
+        while True:
+            try:
+                self.__pool.get_nowait().close()
+            except queue.Empty:
+                break
 
 if __name__ == '__main__':
     api = GuardianAPI()
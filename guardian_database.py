@@ -2,6 +2,7 @@
 import sqlite3
 import logging
 import datetime
+import pandas as pd
 
 # Logging Configuration
 logging.basicConfig(
@@ -10,12 +11,19 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Weekday names indexed by datetime.date.weekday(); avoids locale-dependent strftime('%A')
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
 class GuardianDatabase:
+    # Incremented every time transform() commits, so readers can tell when cached results are stale
+    generation = 0
+
     def __init__(self):
         """
         Constructor for the GuardianDatabase class.
-        Initializes the database connection and cursor as None.
-        These will be set when the 'connect' method is called.
+        Opens the connection and cursor that are kept for the lifetime of the object,
+        so that the tuned PRAGMAs and the page cache persist across method calls.
+        Call 'close' once the database is no longer needed.
         """
         # Initialize the database connection attribute to None.
         self.__connection = None
@@ -23,13 +31,28 @@ class GuardianDatabase:
         # Initialize the database cursor attribute to None.
         self.__cursor = None
 
+        # Open the long-lived connection
+        self.connect()
+
     def connect(self):
         """
         Establishes a connection to the SQLite database and initializes a cursor for database operations.
+
+        This is the writer connection: it switches the database to WAL mode so that the API's
+        read-only connections (which set 'PRAGMA query_only' instead) are not blocked while
+        the scraper job loads and transforms data.
         """
-        # Connect to the SQLite database; 'guardian_database.db' will be created if it doesn't exist
-        self.__connection = sqlite3.connect('guardian_database.db')
-        
+        # Connect to the SQLite database; 'guardian_database.db' will be created if it doesn't exist.
+        # The connection is opened on the main thread but used by the scraper worker thread.
+        self.__connection = sqlite3.connect('guardian_database.db', check_same_thread=False)
+
+        # Tune the connection; journal_mode must be set outside of any transaction
+        self.__connection.execute('PRAGMA journal_mode = WAL;')
+        self.__connection.execute('PRAGMA synchronous = NORMAL;')
+        self.__connection.execute('PRAGMA temp_store = MEMORY;')
+        self.__connection.execute('PRAGMA cache_size = -131072;')
+        self.__connection.execute('PRAGMA mmap_size = 268435456;')
+
         # Create a cursor object using the connection; this cursor is used to execute SQL queries
         self.__cursor = self.__connection.cursor()
 
@@ -37,13 +60,21 @@ class GuardianDatabase:
     def close(self):
         """
         Closes the database cursor and connection to ensure no memory leaks or unwanted open connections.
+        The write-ahead log is checkpointed and truncated first, so the next start does not have to recover it.
         """
+        # Move the WAL content into the database file and empty the WAL
+        self.__cursor.execute('PRAGMA wal_checkpoint(TRUNCATE);')
+
         # Close the cursor; this prevents further SQL operations using this cursor
         self.__cursor.close()
         
         # Close the database connection; this releases the database resources
         self.__connection.close()
 
+        # Mark the object as closed
+        self.__cursor = None
+        self.__connection = None
+
     
     def initialize_database(self):
         """
@@ -51,9 +82,6 @@ class GuardianDatabase:
         If the tables already exist, this method ensures they are not created again.
         """
 
-        # Connect to the database before any operations.
-        self.connect()
-        
         try:
             # Start transaction
             self.__cursor.execute('BEGIN TRANSACTION;')
@@ -69,7 +97,46 @@ class GuardianDatabase:
                     TXT_TEXT TEXT NULL,
                     DAT_VALID_FROM DATETIME NOT NULL,
                     DAT_VALID_TO DATETIME,
-                    BOOL_IS_CURRENT BOOLEAN
+                    BOOL_IS_CURRENT BOOLEAN,
+                    HASH_CONTENT INTEGER NULL
+                )
+            ''')
+
+            # Add the HASH_CONTENT column to tables created before it existed
+            columns = [column[1] for column in self.__cursor.execute('PRAGMA table_info(DWH_D_GUARDIAN);').fetchall()]
+            if 'HASH_CONTENT' not in columns:
+                self.__cursor.execute('ALTER TABLE DWH_D_GUARDIAN ADD COLUMN HASH_CONTENT INTEGER NULL;')
+
+            # Index the current version of each URL with its content hash; used by the change detection in transform()
+            self.__cursor.execute('DROP INDEX IF EXISTS IDX_DWH_D_GUARDIAN_URL_CURR;')
+            self.__cursor.execute('''
+                CREATE INDEX IF NOT EXISTS IDX_DWH_D_GUARDIAN_URL_HASH
+                ON DWH_D_GUARDIAN (TXT_URL, HASH_CONTENT)
+                WHERE BOOL_IS_CURRENT = 1
+            ''')
+
+            # Index the authors of current records; lets the API rank authors with an index-only scan
+            self.__cursor.execute('''
+                CREATE INDEX IF NOT EXISTS IDX_DWH_D_GUARDIAN_AUTHOR_CURR
+                ON DWH_D_GUARDIAN (TXT_AUTHOR)
+                WHERE BOOL_IS_CURRENT = 1
+            ''')
+
+            # Drop landing tables left by older versions, which were recreated on every load without a key or hash
+            columns = {column[1]: column[5] for column in self.__cursor.execute('PRAGMA table_info(LND_GUARDIAN);').fetchall()}
+            if columns and (not columns.get('index') or 'hash_content' not in columns):
+                self.__cursor.execute('DROP TABLE LND_GUARDIAN;')
+
+            # Create the LND_GUARDIAN table, keyed by URL so that load() can upsert batches and transform() can join on it by index lookup
+            self.__cursor.execute('''
+                CREATE TABLE IF NOT EXISTS LND_GUARDIAN (
+                    "index" TEXT PRIMARY KEY,
+                    "category" TEXT,
+                    "date" TEXT,
+                    "headline" TEXT,
+                    "author" TEXT,
+                    "text" TEXT,
+                    "hash_content" INTEGER
                 )
             ''')
 
@@ -87,51 +154,84 @@ class GuardianDatabase:
             ''')
 
             # Check if there's already data in DWH_D_DATE
-            self.__cursor.execute("SELECT COUNT(*) FROM DWH_D_DATE;")
-            count = self.__cursor.fetchone()[0]
+            self.__cursor.execute("SELECT 1 FROM DWH_D_DATE LIMIT 1;")
+            has_dates = self.__cursor.fetchone() is not None
 
             # If the table is empty, proceed with insertion
-            if count == 0:
+            if not has_dates:
                 start_date = datetime.date(2023, 1, 1)
                 end_date = datetime.date(2030, 12, 31)
-                current_date = start_date
+                days = (end_date - start_date).days + 1
 
-                while current_date <= end_date:
-                    year = current_date.year
+                # Build every row first so they can all be bound in a single executemany call
+                rows = []
+                for offset in range(days):
+                    current_date = start_date + datetime.timedelta(days=offset)
                     month = current_date.month
-                    day = current_date.day
-                    weekday_name = current_date.strftime('%A')
-                    is_weekend = 1 if weekday_name in ['Saturday', 'Sunday'] else 0
+                    weekday = current_date.weekday()
+                    weekday_name = WEEKDAY_NAMES[weekday]
+                    is_weekend = 1 if weekday >= 5 else 0
                     quarter = (month - 1) // 3 + 1  # Calculate the quarter
-                    
-                    self.__cursor.execute('''
-                        INSERT INTO DWH_D_DATE (ID_D_DATE, YEAR, QUARTER, MONTH, DAY, WEEKDAY_NAME, IS_WEEKEND)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (current_date, year, quarter, month, day, weekday_name, is_weekend))
-                    
-                    current_date += datetime.timedelta(days=1)
+
+                    rows.append((current_date, current_date.year, quarter, month, current_date.day, weekday_name, is_weekend))
+
+                self.__cursor.executemany('''
+                    INSERT INTO DWH_D_DATE (ID_D_DATE, YEAR, QUARTER, MONTH, DAY, WEEKDAY_NAME, IS_WEEKEND)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+
+            # Rebuild DWH_FT_GUARDIAN if it was created before it had a primary key.
+            # The views depending on it are dropped here and recreated further below.
+            self.__cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'DWH_FT_GUARDIAN';")
+            fact_table = self.__cursor.fetchone()
+            if fact_table and 'PRIMARY KEY' not in fact_table[0]:
+                self.__cursor.execute('DROP VIEW IF EXISTS DTM_V_D_DATE;')
+                self.__cursor.execute('DROP VIEW IF EXISTS DTM_V_D_GUARDIAN;')
+                self.__cursor.execute('DROP VIEW IF EXISTS DTM_V_FT_GUARDIAN;')
+                self.__cursor.execute('ALTER TABLE DWH_FT_GUARDIAN RENAME TO DWH_FT_GUARDIAN_OLD;')
 
             # Create the DWH_FT_GUARDIAN table
             self.__cursor.execute('''
                 CREATE TABLE IF NOT EXISTS DWH_FT_GUARDIAN (
                     ID_D_GUARDIAN INTEGER NOT NULL,
-                    ID_D_DATE DATE NOT NULL
-                )
+                    ID_D_DATE DATE NOT NULL,
+                    PRIMARY KEY (ID_D_GUARDIAN, ID_D_DATE)
+                ) WITHOUT ROWID
             ''')
 
+            # Index the fact table by date; used by the API to look up today's articles
+            self.__cursor.execute('''
+                CREATE INDEX IF NOT EXISTS IDX_DWH_FT_DATE
+                ON DWH_FT_GUARDIAN (ID_D_DATE, ID_D_GUARDIAN)
+            ''')
+
+            # Move the rows of a rebuilt DWH_FT_GUARDIAN over, dropping duplicates
+            if fact_table and 'PRIMARY KEY' not in fact_table[0]:
+                self.__cursor.execute('''
+                    INSERT OR IGNORE INTO DWH_FT_GUARDIAN (ID_D_GUARDIAN, ID_D_DATE)
+                    SELECT ID_D_GUARDIAN, ID_D_DATE FROM DWH_FT_GUARDIAN_OLD;
+                ''')
+                self.__cursor.execute('DROP TABLE DWH_FT_GUARDIAN_OLD;')
+
+            # Recreate the DTM_V_FT_GUARDIAN and DTM_V_D_GUARDIAN views so that definition changes reach existing databases
+            self.__cursor.execute('DROP VIEW IF EXISTS DTM_V_FT_GUARDIAN;')
+            self.__cursor.execute('DROP VIEW IF EXISTS DTM_V_D_GUARDIAN;')
+
             # Create the DTM_V_FT_GUARDIAN view
             self.__cursor.execute('''
-                CREATE VIEW IF NOT EXISTS DTM_V_FT_GUARDIAN AS
+                CREATE VIEW DTM_V_FT_GUARDIAN AS
                 SELECT 
                     ft."ID_D_GUARDIAN"          AS "ID Guardian"
                     ,ft."ID_D_DATE"             AS "ID Date"
                 FROM DWH_FT_GUARDIAN AS ft
-                WHERE ft."ID_D_GUARDIAN" IN (SELECT d."ID_D_GUARDIAN" FROM DWH_D_GUARDIAN AS d WHERE d.BOOL_IS_CURRENT = 1);
+                INNER JOIN DWH_D_GUARDIAN AS d
+                    ON d."ID_D_GUARDIAN" = ft."ID_D_GUARDIAN"
+                    AND d.BOOL_IS_CURRENT = 1;
             ''')
 
             # Create DTM_V_D_GUARDIAN view
             self.__cursor.execute('''
-                CREATE VIEW IF NOT EXISTS DTM_V_D_GUARDIAN AS
+                CREATE VIEW DTM_V_D_GUARDIAN AS
                 SELECT 
                     d."ID_D_GUARDIAN"           AS "ID Guardian"
                     ,d."TXT_URL"                AS "URL"
@@ -140,7 +240,7 @@ class GuardianDatabase:
                     ,d."TXT_AUTHOR"             AS "Author"
                     ,d."TXT_TEXT"               AS "Text"
                 FROM DWH_D_GUARDIAN AS d
-                WHERE d.ID_D_GUARDIAN IN (SELECT ft."ID Guardian" FROM DTM_V_FT_GUARDIAN AS ft);
+                WHERE d.BOOL_IS_CURRENT = 1;
             ''')
 
             # Create DTM_V_D_DATE view
@@ -160,49 +260,59 @@ class GuardianDatabase:
                     AND d.ID_D_DATE <= (SELECT MAX(ft."ID Date") FROM DTM_V_FT_GUARDIAN AS ft);
             ''')
 
+            # Refresh the planner statistics so the indexes above are picked up
+            self.__cursor.execute('ANALYZE;')
+
             # Commit transaction
             self.__cursor.execute('COMMIT;')
         except sqlite3.Error as e:
             # Rollback if there's an error
             self.__connection.rollback()
             print(f"SQLite error: {e}")
-        finally:
-            # Always close the connection at the end
-            self.close()
     
     def load(self, dataframe):
         """
         Loads data from the provided dataframe into the database.
 
         Parameters:
-        - dataframe (pandas.DataFrame): The dataframe containing the data to be loaded.
+        - dataframe (pandas.DataFrame): The dataframe containing the data to be loaded, with one row per article
+          and the columns url, category, date, headline, author and text.
 
         Note: 
-        The data is loaded into a table named 'LND_GUARDIAN'. If the table already exists, 
-        the existing data will be replaced by the new data from the dataframe.
+        The data is added to the table named 'LND_GUARDIAN', replacing the rows of URLs that are already there.
+        The scraper calls this once per batch, so the landed rows survive a crash until transform() consumes them.
+        A 'hash_content' column is added, hashing the category, headline, author and text of each
+        article so that transform() can detect changes with a single comparison.
         """
 
-        # Connect to the database before loading the data.
-        self.connect()
-        
+        # Hash the content columns; the unsigned hashes are reinterpreted as signed to fit SQLite's INTEGER
+        hashes = pd.util.hash_pandas_object(dataframe[['category', 'headline', 'author', 'text']], index=False)
+        dataframe = dataframe.assign(hash_content=hashes.to_numpy().view('int64'))
+
         try:
-            # Insert data from the dataframe into the LND_GUARDIAN table
-            dataframe.to_sql('LND_GUARDIAN', self.__connection, if_exists='replace', index=True)
+            # Start transaction
+            self.__cursor.execute('BEGIN TRANSACTION;')
+
+            # Insert data from the dataframe into the LND_GUARDIAN table in a single batch
+            rows = dataframe[['url', 'category', 'date', 'headline', 'author', 'text', 'hash_content']].itertuples(index=False, name=None)
+            self.__cursor.executemany('''
+                INSERT OR REPLACE INTO LND_GUARDIAN ("index", "category", "date", "headline", "author", "text", "hash_content")
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+            # Commit transaction
+            self.__cursor.execute('COMMIT;')
         except sqlite3.Error as e:
+            # Rollback if there's an error
+            self.__connection.rollback()
             print(f"SQLite error: {e}")
-        finally:
-            # Always close the connection at the end
-            self.close()
     
     def transform(self):
         """
-        This method transforms data by connecting to the database, 
-        making the necessary changes, and updating records.
+        This method transforms data by making the necessary changes
+        in the database and updating records.
         """
         
-        # Connect to the database before loading the data.
-        self.connect()
-
         try:
             # Start transaction
             self.__cursor.execute('BEGIN TRANSACTION;')
@@ -211,27 +321,55 @@ class GuardianDatabase:
             self.__cursor.execute('SELECT COUNT(*) FROM DWH_D_GUARDIAN WHERE BOOL_IS_CURRENT = 1;')
             initial_count = self.__cursor.fetchone()[0]
 
-            # Step 1: Expire records that have actual changes
+            # Step 1: Fill in the hash of current records stored before HASH_CONTENT existed, if their content is unchanged
+            self.__cursor.execute('''
+                UPDATE DWH_D_GUARDIAN
+                SET HASH_CONTENT = (
+                    SELECT lnd."hash_content"
+                    FROM LND_GUARDIAN AS lnd
+                    WHERE
+                        lnd."index" = DWH_D_GUARDIAN.TXT_URL
+                        AND lnd."category" IS DWH_D_GUARDIAN.TXT_CATEGORY
+                        AND lnd."headline" IS DWH_D_GUARDIAN.TXT_HEADLINE
+                        AND lnd."author" IS DWH_D_GUARDIAN.TXT_AUTHOR
+                        AND lnd."text" IS DWH_D_GUARDIAN.TXT_TEXT
+                )
+                WHERE
+                    BOOL_IS_CURRENT = 1
+                    AND HASH_CONTENT IS NULL
+                    AND TXT_URL IN (SELECT lnd."index" FROM LND_GUARDIAN AS lnd);
+            ''')
+
+            # Step 2: Identify new or changed records by comparing the landing table with the current dimension rows
+            self.__cursor.execute('''
+                CREATE TEMP TABLE TMP_GUARDIAN_CHANGED AS
+                SELECT
+                    lnd."index"             AS TXT_URL
+                    ,lnd."category"         AS TXT_CATEGORY
+                    ,lnd."headline"         AS TXT_HEADLINE
+                    ,lnd."author"           AS TXT_AUTHOR
+                    ,lnd."text"             AS TXT_TEXT
+                    ,lnd."hash_content"     AS HASH_CONTENT
+                    ,dwh.TXT_URL IS NULL    AS BOOL_IS_NEW
+                FROM LND_GUARDIAN AS lnd
+                LEFT JOIN DWH_D_GUARDIAN AS dwh
+                    ON lnd."index" = dwh.TXT_URL
+                    AND dwh.BOOL_IS_CURRENT = 1
+                WHERE
+                    dwh.TXT_URL IS NULL
+                    OR dwh.HASH_CONTENT IS NOT lnd."hash_content";
+            ''')
+
+            # Step 3: Expire the current version of records that have actual changes
             self.__cursor.execute('''
                 UPDATE DWH_D_GUARDIAN
                 SET DAT_VALID_TO = CURRENT_TIMESTAMP, BOOL_IS_CURRENT = 0
                 WHERE
-                    TXT_URL IN (
-                        SELECT
-                            dwh.TXT_URL
-                        FROM DWH_D_GUARDIAN AS dwh
-                        JOIN LND_GUARDIAN AS lnd
-                            ON dwh.TXT_URL = lnd."index"
-                        WHERE
-                            dwh.TXT_CATEGORY != lnd."category"
-                            OR dwh.TXT_HEADLINE != lnd."headline"
-                            OR dwh.TXT_AUTHOR != lnd."author"
-                            OR dwh.TXT_TEXT != lnd."text"
-                    )
-                    AND BOOL_IS_CURRENT = 1;
+                    BOOL_IS_CURRENT = 1
+                    AND TXT_URL IN (SELECT chg.TXT_URL FROM TMP_GUARDIAN_CHANGED AS chg WHERE chg.BOOL_IS_NEW = 0);
             ''')
 
-            # Step 2: Insert new or changed records from the landing table to dimension table
+            # Step 4: Insert new or changed records from the landing table to dimension table
             self.__cursor.execute('''
                 INSERT INTO DWH_D_GUARDIAN
                 (
@@ -240,32 +378,28 @@ class GuardianDatabase:
                     ,TXT_HEADLINE
                     ,TXT_AUTHOR
                     ,TXT_TEXT
+                    ,HASH_CONTENT
                     ,DAT_VALID_FROM
                     ,DAT_VALID_TO
                     ,BOOL_IS_CURRENT
                 )
                 SELECT
-                    lnd."index"             AS TXT_URL
-                    ,lnd."category"         AS TXT_CATEGORY
-                    ,lnd."headline"         AS TXT_HEADLINE
-                    ,lnd."author"           AS TXT_AUTHOR
-                    ,lnd."text"             AS TXT_TEXT
+                    chg.TXT_URL
+                    ,chg.TXT_CATEGORY
+                    ,chg.TXT_HEADLINE
+                    ,chg.TXT_AUTHOR
+                    ,chg.TXT_TEXT
+                    ,chg.HASH_CONTENT
                     ,CURRENT_TIMESTAMP      AS DAT_VALID_FROM
                     ,NULL                   AS DAT_VALID_TO
                     ,1                      AS BOOL_IS_CURRENT
-                FROM LND_GUARDIAN AS lnd
-                LEFT JOIN DWH_D_GUARDIAN dwh
-                    ON lnd."index" = dwh.TXT_URL
-                    AND dwh.BOOL_IS_CURRENT = 1
-                WHERE
-                    dwh.TXT_URL IS NULL 
-                    OR dwh.TXT_CATEGORY != lnd."category"
-                    OR dwh.TXT_HEADLINE != lnd."headline"
-                    OR dwh.TXT_AUTHOR != lnd."author"
-                    OR dwh.TXT_TEXT != lnd."text";
+                FROM TMP_GUARDIAN_CHANGED AS chg;
             ''')
 
-            # Step 3: Insert new records from the landing table to dimension table
+            # The change set is only needed for this run
+            self.__cursor.execute('DROP TABLE TMP_GUARDIAN_CHANGED;')
+
+            # Step 5: Insert new records from the landing table to fact table
             self.__cursor.execute('''
                 INSERT OR IGNORE INTO DWH_FT_GUARDIAN (ID_D_GUARDIAN, ID_D_DATE)
                 SELECT
@@ -274,11 +408,12 @@ class GuardianDatabase:
                 FROM DWH_D_GUARDIAN AS dwh
                 INNER JOIN LND_GUARDIAN AS lnd
                     ON dwh.TXT_URL = lnd."index"
-                WHERE
-                    BOOL_IS_CURRENT = 1
-                    AND NOT EXISTS (SELECT 1 FROM DWH_FT_GUARDIAN ft WHERE ft.ID_D_GUARDIAN = dwh.ID_D_GUARDIAN);
+                WHERE dwh.BOOL_IS_CURRENT = 1;
             ''')
 
+            # Step 6: Empty the landing table now that its rows are in the data warehouse
+            self.__cursor.execute('DELETE FROM LND_GUARDIAN;')
+
             # Get the count after changes
             self.__cursor.execute('SELECT COUNT(*) FROM DWH_D_GUARDIAN WHERE BOOL_IS_CURRENT = 1;')
             final_count = self.__cursor.fetchone()[0]
@@ -290,14 +425,34 @@ class GuardianDatabase:
 
             # Commit transaction
             self.__cursor.execute('COMMIT;')
+
+            # Signal readers that the data has changed
+            GuardianDatabase.generation += 1
         except sqlite3.Error as e:
             # Rollback if there's an error
             self.__connection.rollback()
             print(f"SQLite error: {e}")
-        finally:
-            # Always close the connection at the end
-            self.close()
     
+    def get_scraped_urls(self) -> set:
+        """
+        Returns the URLs of the articles that were already scraped.
+
+        Returns:
+        - set: The URLs of the current records of DWH_D_GUARDIAN, and of the records landed in
+          LND_GUARDIAN that are still waiting to be transformed.
+        """
+
+        try:
+            rows = self.__cursor.execute('''
+                SELECT TXT_URL FROM DWH_D_GUARDIAN WHERE BOOL_IS_CURRENT = 1
+                UNION
+                SELECT "index" FROM LND_GUARDIAN;
+            ''').fetchall()
+            return {url for (url,) in rows}
+        except sqlite3.Error as e:
+            print(f"SQLite error: {e}")
+            return set()  # Return a default value
+
     def has_data(self) -> bool:
         """
         Checks if the DWH_D_GUARDIAN table has any data.
@@ -305,18 +460,13 @@ class GuardianDatabase:
         Returns:
         - bool: True if the table has data, False otherwise.
 
-        This method connects to the database, retrieves a count of the records in the
-        DWH_D_GUARDIAN table, and then determines if the table is empty based on that count.
+        This method looks up a single record of the DWH_D_GUARDIAN table,
+        and then determines if the table is empty based on whether one was found.
         """
 
-        # Connect to the database before loading the data.
-        self.connect()
-
         try:
-            count = self.__cursor.execute("SELECT COUNT(*) FROM DWH_D_GUARDIAN;").fetchone()[0]
-            return count > 0
+            row = self.__cursor.execute("SELECT 1 FROM DWH_D_GUARDIAN LIMIT 1;").fetchone()
+            return row is not None
         except sqlite3.Error as e:
             print(f"SQLite error: {e}")
-            return False  # Return a default value
-        finally:
-            self.close()
\ No newline at end of file
+            return False  # Return a default value
\ No newline at end of file
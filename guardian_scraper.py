@@ -1,24 +1,87 @@
 # Libraries
 import re
+import asyncio
 import string
 import pandas as pd
 import requests
+import httpx
 import sqlite3
 import logging
-from bs4 import BeautifulSoup as bs
-from typing import List
-from datetime import datetime
+from lxml import etree, html
+from selectolax.lexbor import LexborHTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import List, Iterator, Optional
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 # Set up the logging configuration
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s',
                     datefmt='%Y-%m-%d %H:%M:%S')
+logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; keep scrape_data_async down to the scraper's own progress messages
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# HTTP settings
+REQUEST_TIMEOUT = 10  # Seconds to wait for The Guardian to respond
+USER_AGENT = 'Mozilla/5.0 (compatible; GuardianScraper/1.0; +https://github.com/dylanarnaud/Guardian-Scraper)'
+
+# Parsing settings: the link of each article on a listing page is the first link inside its 'fc-item__content' element,
+# whose class attribute may hold several classes
+LISTING_LINKS = etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " fc-item__content ")]/descendant::a[1]/@href', smart_strings=False)
+
+# Concurrency settings
+MAX_WORKERS = 16  # Number of pages fetched at the same time
+PAGE_BATCH_SIZE = 8  # Number of listing pages fetched before checking for the target URL
+LOAD_BATCH_SIZE = 200  # Number of articles handed over for persisting at a time
+PROGRESS_LOG_INTERVAL = 25  # Number of articles scraped between two progress messages
+ASYNC_CONCURRENCY = 20  # Number of articles fetched at the same time by scrape_data_async
+ASYNC_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Columns of the scraped data
+COLUMNS = ['url', 'category', 'date', 'headline', 'author', 'text']
+
+# URL date settings: The Guardian writes the month as its lowercase three-letter abbreviation
+_MONTHS = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+           'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+
+# URL patterns, compiled once instead of on every call
+@lru_cache(maxsize=32)
+def _category_re(category: str, filter_by_date: bool) -> re.Pattern:
+    """Returns the compiled pattern matching `/{category}/` in a URL, followed by `{year}/{month}/{day}/` if filter_by_date is set."""
+    date_part = r'\d{4}/[a-z]+/\d{1,2}/' if filter_by_date else ''
+    return re.compile(rf'/{re.escape(category)}/{date_part}')
+
+@dataclass(slots=True)
+class ArticleDetails:
+    """The author, headline and text extracted from an article page; slotted, as one is created per article."""
+    author: Optional[str] = None
+    headline: Optional[str] = None
+    text: Optional[str] = None
 
 class GuardianScraper:
     def __init__(self):
         self.data = None
 
-    def __generate_guardian_world_urls(self, end_page: int) -> list:
+        # Share one session across all requests so that connections to The Guardian are kept alive and reused
+        self.__session = requests.Session()
+        # Once the retries are used up, return the last response instead of raising, so that the status code checks below apply
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        self.__session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=MAX_WORKERS, max_retries=retries))
+        # Ask for compressed pages in every encoding urllib3 can decode (gzip, deflate, and br when Brotli is installed)
+        self.__session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING})
+
+    def close(self):
+        """
+        Closes the HTTP session and the connections it keeps open.
+        """
+        self.__session.close()
+
+    def __generate_guardian_world_urls(self, end_page: int) -> Iterator[str]:
         """
         Generates Guardian "world" section URLs up to a certain page number.
         
@@ -26,15 +89,11 @@ class GuardianScraper:
         - end_page (int): The last page number up to which URLs should be generated.
         
         Returns:
-        - list: A list of URLs for the Guardian "world" section up to the specified page number.
+        - Iterator[str]: A lazy iterator over the URLs for the Guardian "world" section up to the specified page number.
         """
         
-        base_url = "https://www.theguardian.com/world?page="
-        
-        # Generate URLs for each page number from 1 to end_page
-        urls = [base_url + str(page) for page in range(1, end_page + 1)]
-        
-        return urls
+        # Generate URLs for each page number from 1 to end_page, one at a time as they are consumed
+        return (f"https://www.theguardian.com/world?page={page}" for page in range(1, end_page + 1))
 
     def __extract_guardian_world_links(self, url: str = "https://www.theguardian.com/world?page=1") -> list:
         """
@@ -47,19 +106,25 @@ class GuardianScraper:
         - list: A list of URLs extracted from the page. Returns an empty list if no URLs are found.
         """
         
-        # Send a GET request to retrieve the page content
-        response = requests.get(url)
-        
-        # Ensure a successful response
-        if response.status_code != 200:
-            print(f"Failed to retrieve the page. Status code: {response.status_code}")
+        # Send a GET request to retrieve the page content; the body is streamed and read in one call,
+        # and the connection goes back to the pool when the response is closed
+        with self.__session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            # Ensure a successful response
+            if response.status_code != 200:
+                print(f"Failed to retrieve the page. Status code: {response.status_code}")
+                return []
+
+            content = response.raw.read(decode_content=True)
+
+        # An empty page has no links, and lxml refuses to parse it
+        if not content:
             return []
 
-        # Parse the content using BeautifulSoup
-        soup = bs(response.content, 'html.parser')
+        # Parse the raw bytes using lxml, which detects the encoding from the page itself
+        document = html.fromstring(content)
         
         # Extract URLs from elements with class 'fc-item__content'
-        urls = [link.a['href'] for link in soup.find_all('div', class_='fc-item__content') if link.a]
+        urls = LISTING_LINKS(document)
         
         return urls
     
@@ -72,23 +137,27 @@ class GuardianScraper:
         page_urls = self.__generate_guardian_world_urls(end_page)
 
         all_article_urls = []
-        for index, page_url in enumerate(page_urls, 1):  # Start enumeration from 1 for human-readable page numbers
-            logging.info(f"Scraping links from page {index} out of {end_page}.")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Fetch the pages concurrently, one batch at a time so that no more pages than needed are requested
+            # once the target_url is found
+            for batch_start in range(0, end_page, PAGE_BATCH_SIZE):
+                batch = list(islice(page_urls, PAGE_BATCH_SIZE))
 
-            # Extract article URLs from the current page
-            article_urls = self.__extract_guardian_world_links(page_url)
+                # Extract article URLs from the pages of the batch, in page order
+                for index, article_urls in enumerate(executor.map(self.__extract_guardian_world_links, batch), batch_start + 1):
+                    logger.info("Scraping links from page %d out of %d.", index, end_page)
 
-            # Provide feedback on how many article links were scraped from the current page
-            #print(f"Retrieved {len(article_urls)} links from page {index}.")
+                    # Provide feedback on how many article links were scraped from the current page
+                    #print(f"Retrieved {len(article_urls)} links from page {index}.")
 
-            if target_url and target_url in article_urls:
-                # If target_url is found among the article URLs, 
-                # append all the URLs up to (but not including) the target_url, 
-                # then break out of the loop.
-                all_article_urls.extend(article_urls[:article_urls.index(target_url)])
-                break
-            else:
-                all_article_urls.extend(article_urls)
+                    if target_url and target_url in article_urls:
+                        # If target_url is found among the article URLs, 
+                        # append all the URLs up to (but not including) the target_url, 
+                        # then stop collecting.
+                        all_article_urls.extend(article_urls[:article_urls.index(target_url)])
+                        return all_article_urls
+                    else:
+                        all_article_urls.extend(article_urls)
 
         return all_article_urls
 
@@ -106,216 +175,291 @@ class GuardianScraper:
         - list: A list of filtered URLs.
         """
         
-        # First filter by category
-        filtered_urls = [url for url in urls if f"/{category}/" in url]
-        
-        # If filter_by_date is True, further filter the URLs to match the pattern:
+        # Filter by category and, if filter_by_date is True, by date in a single regex pass matching the pattern:
         # `https://www.theguardian.com/{category}/{year}/{month}/{day}/...`.
         # Where:
         # - {year} is a 4-digit representation of the year.
-        # - {month} is the full lowercase representation of the month (e.g., 'january', 'february').
+        # - {month} is the lowercase three-letter abbreviation of the month (e.g., 'jan', 'feb').
         # - {day} is a 1 or 2-digit representation of the day of the month (e.g., '1', '31').
-        if filter_by_date:
-            pattern = re.compile(rf'/{category}/\d{{4}}/[a-z]+/\d{{1,2}}/')
-            filtered_urls = [url for url in filtered_urls if pattern.search(url)]
-                
-        return filtered_urls
-    
-    def __get_category(self, url: str) -> str:
-        """
-        Extracts the main category from a given The Guardian URL using string manipulation.
-        
-        Parameters:
-        - url (str): The URL from which the main category is to be extracted.
-        
-        Returns:
-        - str: The extracted main category. Returns None if the URL is not in the expected format or category is not found.
-        """
-        
-        # Strip the leading "https://www.theguardian.com/" from the URL
-        stripped_url = url.replace("https://www.theguardian.com/", "")
-        
-        # Split the remaining string by '/'
-        segments = stripped_url.split('/')
-        
-        # The first segment should be the main category
-        if segments:
-            return segments[0]
+        pattern = _category_re(category, filter_by_date)
         
-        # Return None if category can't be extracted
-        return None
-
+        return list(filter(pattern.search, urls))
+    
     def __get_article_date(self, url: str) -> str:
         """
-        Extracts the article's date from a given The Guardian URL using regex.
+        Extracts the article's date from a given The Guardian URL using string manipulation.
         
         Parameters:
         - url (str): The URL from which the article's date is to be extracted.
         
         Returns:
-        - datetime.date: The extracted date as a date object. 
-                        Returns None if the URL is not in the expected format or date is not found.
+        - str: The extracted date in ISO format (YYYY-MM-DD). 
+               Returns None if the URL is not in the expected format or date is not found.
         """
         
-        # Use regex to extract the date in the format YYYY/MON/DD from the URL
-        match = re.search(r'/(\d{4}/[a-z]+/\d{1,2})/', url)
-        
-        # If a match is found, transform the matched string to a date object
-        if match:
-            year, month_str, day = match.group(1).split('/')
-            month = datetime.strptime(month_str, '%b').month
-            # Convert the date object to a string
-            return datetime(int(year), month, int(day)).date().isoformat()
+        # Split the URL by '/' and look for the segments in the format YYYY/MON/DD
+        segments = url.split('/')
+        for i in range(len(segments) - 2):
+            year, month, day = segments[i:i + 3]
+            if len(year) == 4 and year.isdigit() and month in _MONTHS and day.isdigit():
+                # Build the ISO date string directly from the segments
+                return f"{year}-{_MONTHS[month]:02d}-{int(day):02d}"
         
         # Return None if date can't be extracted
         return None
     
-    def __get_author(self, url: str) -> str:
+    def __get_author(self, tree: LexborHTMLParser) -> str:
         """
-        Fetches and extracts the author's name from a given URL.
+        Extracts the author's name from a parsed article page.
         
         Parameters:
-        - url (str): The URL of the web page to extract the author's name from.
+        - tree (LexborHTMLParser): The parsed content of the article page.
         
         Returns:
         - str: The extracted author's name from the target element on the webpage. 
-            Returns None if the page retrieval was unsuccessful or if the target element was not found.
+            Returns None if the target element was not found.
         """
         
-        # Send a GET request to the provided URL to retrieve the page content
-        article = requests.get(url)
-        
-        # Check if the GET request was successful (status code 200)
-        # If not, the function will return None indicating the article couldn't be fetched.
-        if article.status_code != 200:
-            return None
-
-        # Parse the page content using BeautifulSoup to create a navigable structure
-        soup = bs(article.content, 'html.parser')
-        
         # Attempt to find the target element based on its attributes
-        target_element = soup.find('a', attrs={'rel': 'author', 'data-link-name': 'auto tag link'})
+        target_element = tree.css_first('a[rel~="author"][data-link-name="auto tag link"]')
         
         # Check if the target element was found:
         # If found, return its text content.
         # If not found, return None.
-        return target_element.text if target_element else None
+        return target_element.text() if target_element else None
     
-    def __get_headline(self, url: str) -> str:
+    def __get_headline(self, tree: LexborHTMLParser) -> str:
         """
-        Fetches and extracts the headline of an article from a given URL.
+        Extracts the headline from a parsed article page.
         
         Parameters:
-        - url (str): The URL of the web page to extract the headline from.
+        - tree (LexborHTMLParser): The parsed content of the article page.
         
         Returns:
         - str: The extracted headline from the target element on the webpage. 
-            Returns None if the page retrieval was unsuccessful or if the target element was not found.
+            Returns None if the target element was not found.
         """
         
-        # Send a GET request to the provided URL to retrieve the page content
-        article = requests.get(url)
-        
-        # Check if the GET request was successful (status code 200)
-        # If not, the function will return None indicating the article couldn't be fetched.
-        if article.status_code != 200:
-            return None
+        # Attempt to find the <h1> tag inside the element with the headline data attribute
+        headline = tree.css_first('div[data-gu-name="headline"] h1')
+        if headline:
+            return headline.text()
 
-        # Parse the page content using BeautifulSoup to create a navigable structure
-        soup = bs(article.content, 'html.parser')
+        return None
+    
+    def __get_text(self, tree: LexborHTMLParser) -> str:
+        """
+        Extracts the main text content from a parsed article page.
         
-        # Attempt to find the target element based on the data attribute and then locate the <h1> tag
-        headline_div = soup.find('div', attrs={'data-gu-name': 'headline'})
-        if headline_div:
-            headline = headline_div.find('h1')
-            if headline:
-                return headline.text
+        Parameters:
+        - tree (LexborHTMLParser): The parsed content of the article page.
+        
+        Returns:
+        - str: The extracted text content from the target element on the webpage. 
+            Returns None if the target element was not found.
+        """
+        
+        # Attempt to find the target element based on the data attribute and then extract its text
+        text_div = tree.css_first('div[data-gu-name="body"]')
+        if text_div:
+            return text_div.text().strip()
 
         return None
     
-    def __get_text(self, url: str) -> str:
+    def __parse_article(self, url: str) -> ArticleDetails:
         """
-        Fetches and extracts the main text content of an article from a given URL.
+        Fetches an article once and extracts its author, headline and text content from that single response.
         
         Parameters:
-        - url (str): The URL of the web page to extract the text content from.
+        - url (str): The URL of the article to fetch.
         
         Returns:
-        - str: The extracted text content from the target element on the webpage. 
-            Returns None if the page retrieval was unsuccessful or if the target element was not found.
+        - ArticleDetails: The 'author', 'headline' and 'text' of the article. 
+            All values are None if the page retrieval was unsuccessful.
         """
         
         # Send a GET request to the provided URL to retrieve the page content
-        article = requests.get(url)
+        # The body is streamed and read in one call, and the connection goes back to the pool when the response is closed
+        with self.__session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as article:
+            # Check if the GET request was successful (status code 200)
+            # If not, the details are returned empty indicating the article couldn't be fetched.
+            if article.status_code != 200:
+                return ArticleDetails()
+
+            content = article.raw.read(decode_content=True)
+
+        return self.__parse_article_content(content)
+
+    async def __parse_article_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> ArticleDetails:
+        """
+        Asynchronous counterpart of __parse_article, fetching the article with the given httpx client.
+        
+        Parameters:
+        - client (httpx.AsyncClient): The client used to fetch the article.
+        - semaphore (asyncio.Semaphore): Bounds the number of articles fetched at the same time.
+        - url (str): The URL of the article to fetch.
+        
+        Returns:
+        - ArticleDetails: The 'author', 'headline' and 'text' of the article. 
+            All values are None if the page retrieval was unsuccessful.
+        """
+        
+        # Send a GET request to the provided URL to retrieve the page content
+        async with semaphore:
+            article = await client.get(url)
         
         # Check if the GET request was successful (status code 200)
-        # If not, the function will return None indicating the article couldn't be fetched.
         if article.status_code != 200:
-            return None
+            return ArticleDetails()
+
+        # Parse the page in a worker thread so that the event loop keeps fetching the other articles
+        return await asyncio.to_thread(self.__parse_article_content, article.content)
 
-        # Parse the page content using BeautifulSoup to create a navigable structure
-        soup = bs(article.content, 'html.parser')
+    def __parse_article_content(self, content: bytes) -> ArticleDetails:
+        """
+        Extracts the author, headline and text content from the content of an article page.
         
-        # Attempt to find the target element based on the data attribute and then extract its text
-        text_div = soup.find('div', attrs={'data-gu-name': 'body'})
-        if text_div:
-            return text_div.text.strip()
+        Parameters:
+        - content (bytes): The raw content of the article page.
+        
+        Returns:
+        - ArticleDetails: The 'author', 'headline' and 'text' of the article.
+        """
+        
+        # Parse the page content using selectolax to create a tree that can be queried with CSS selectors
+        tree = LexborHTMLParser(content)
 
-        return None
-    
-    def __fetch_world_articles_details(self, end_page: int = 1) -> dict:
+        # Remove inline scripts and styles, whose contents BeautifulSoup's .text left out of the extracted text
+        tree.strip_tags(['script', 'style'])
+        
+        return ArticleDetails(
+            author=self.__get_author(tree),
+            headline=self.__get_headline(tree),
+            text=self.__get_text(tree)
+        )
+
+    def __collect_world_article_urls(self, end_page: int = 1, skip_urls: set = None) -> list:
         """
-        Fetches details (category, headline, author, and text) for articles from the 'world' category up to a specified page number.
+        Collects the URLs of the articles from the 'world' category up to a specified page number.
 
         Parameters:
-        - end_page (int): The last page number up to which articles should be fetched. Default is 1.
+        - end_page (int): The last page number up to which article URLs should be collected. Default is 1.
+        - skip_urls (set): URLs of articles that were already scraped and must not be fetched again. Default is None.
 
         Returns:
-        - dict: A dictionary with URLs as keys and their details as values.
+        - list: A list of article URLs.
         """
         
-        logging.info(f"Starting the scraping process for up to {end_page} pages.")
+        logger.info("Starting the scraping process for up to %d pages.", end_page)
         
         # Fetching the list of all article URLs
         all_article_urls = self.__collect_urls_until_target(end_page=end_page)
         
         # Filter all articles to retain only the ones from the 'world' category
         world_article_urls = self.__filter_urls_by_category(urls=all_article_urls, category="world", filter_by_date=True)
+
+        # An article may be listed on several pages; keep only its first occurrence so that it is fetched once
+        world_article_urls = list(dict.fromkeys(world_article_urls))
+
+        # Leave out the articles that were already scraped, before any request is sent for them
+        if skip_urls:
+            total_urls = len(world_article_urls)
+            world_article_urls = [url for url in world_article_urls if url not in skip_urls]
+            logger.info("Skipping %d articles that were already scraped.", total_urls - len(world_article_urls))
         
         # Logging the total number of articles to be processed
+        logger.info("Total articles to process from 'world' category: %d", len(world_article_urls))
+
+        return world_article_urls
+
+    def __append_row(self, columns: dict, url: str, category: str, details: ArticleDetails):
+        """
+        Appends the row of an article to the column lists, from its URL and the details extracted from its page.
+
+        Parameters:
+        - columns (dict): The column lists, keyed by column name, to append to.
+        - url (str): The URL of the article.
+        - category (str): The category the URL was filtered by, which is the main category of the article.
+        - details (ArticleDetails): The 'author', 'headline' and 'text' of the article.
+        """
+        
+        columns["url"].append(url)
+        columns["category"].append(category)
+        columns["date"].append(self.__get_article_date(url))
+        columns["headline"].append(details.headline)
+        columns["author"].append(details.author)
+        columns["text"].append(details.text)
+    
+    def __fetch_world_articles_details(self, end_page: int = 1, batch_size: int = LOAD_BATCH_SIZE, skip_urls: set = None):
+        """
+        Fetches details (category, headline, author, and text) for articles from the 'world' category up to a specified page number.
+
+        Parameters:
+        - end_page (int): The last page number up to which articles should be fetched. Default is 1.
+        - batch_size (int): The number of articles in each yielded batch. Default is LOAD_BATCH_SIZE.
+        - skip_urls (set): URLs of articles that were already scraped and must not be fetched again. Default is None.
+
+        Yields:
+        - dict: A batch of articles as column lists keyed by column name, one entry per article with its URL and details.
+        """
+        
+        # Fetching the URLs of the articles to process
+        world_article_urls = self.__collect_world_article_urls(end_page=end_page, skip_urls=skip_urls)
         total_articles = len(world_article_urls)
-        logging.info(f"Total articles to process from 'world' category: {total_articles}")
-
-        # Initialize the result dictionary
-        result = {}
-
-        for index, url in enumerate(world_article_urls, start=1):
-            # Log the scraping progress
-            logging.info(f"Scraping article {index} out of {total_articles}: {url}")
-            
-            # Get the details for each article
-            category = self.__get_category(url)
-            article_date = self.__get_article_date(url)
-            author = self.__get_author(url)
-            headline = self.__get_headline(url)
-            text = self.__get_text(url)
-
-            # Add the details to the result dictionary
-            result[url] = {
-                "category": category,
-                "date": article_date,
-                "headline": headline,
-                "author": author,
-                "text": text
-            }
-
-        logging.info(f"Finished scraping {total_articles} articles from 'world' category.")
-        
-        return result
-
-    def scrape_data(self, page_count = 1):
+
+        # Fetch and parse the articles concurrently, one batch at a time; results are returned in the order of the URLs.
+        # Only the fetches of the current batch are submitted, so none are in flight while a batch is handed over
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for batch_start in range(0, total_articles, batch_size):
+                batch_urls = world_article_urls[batch_start:batch_start + batch_size]
+
+                # Initialize the batch columns; one list per column avoids allocating a dictionary per article
+                columns = {column: [] for column in COLUMNS}
+
+                articles = zip(batch_urls, executor.map(self.__parse_article, batch_urls))
+                for index, (url, details) in enumerate(articles, start=batch_start + 1):
+                    # Log the scraping progress every PROGRESS_LOG_INTERVAL articles rather than for each one
+                    if index % PROGRESS_LOG_INTERVAL == 0:
+                        logger.info("Scraping article %d out of %d: %s", index, total_articles, url)
+
+                    # Add the details to the batch columns; the URLs were filtered by the 'world' category
+                    self.__append_row(columns, url, "world", details)
+
+                # Hand over the batch so that it can be persisted before the next articles are scraped
+                yield columns
+
+        logger.info("Finished scraping %d articles from 'world' category.", total_articles)
+
+    def scrape_batches(self, page_count = 1, batch_size = LOAD_BATCH_SIZE, skip_urls = None):
+        # Fetch the article details and convert each batch to a DataFrame as soon as it is complete
+        for columns in self.__fetch_world_articles_details(end_page = page_count, batch_size = batch_size, skip_urls = skip_urls):
+            yield pd.DataFrame(columns, columns=COLUMNS)
+
+    def scrape_data(self, page_count = 1, skip_urls = None):
         # Fetch the article details
-        articles_details = self.__fetch_world_articles_details(end_page = page_count)
+        articles_details = {column: [] for column in COLUMNS}
+        for columns in self.__fetch_world_articles_details(end_page = page_count, skip_urls = skip_urls):
+            for column in COLUMNS:
+                articles_details[column].extend(columns[column])
+
+        # Convert the columns to a DataFrame
+        self.data = pd.DataFrame(articles_details, columns=COLUMNS)
+
+    async def scrape_data_async(self, page_count = 1, skip_urls = None):
+        # Collect the article URLs in a worker thread; the listing pages are few and fetched with the pooled session
+        world_article_urls = await asyncio.to_thread(self.__collect_world_article_urls, end_page = page_count, skip_urls = skip_urls)
+
+        # Fetch the articles concurrently over HTTP/2, which multiplexes the requests over a few connections
+        semaphore = asyncio.Semaphore(ASYNC_CONCURRENCY)
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=ASYNC_LIMITS, retries=3)
+        async with httpx.AsyncClient(transport=transport, timeout=REQUEST_TIMEOUT, follow_redirects=True,
+                                     headers={'User-Agent': USER_AGENT}) as client:
+            articles_details = await asyncio.gather(*(self.__parse_article_async(client, semaphore, url) for url in world_article_urls))
+
+        logger.info("Finished scraping %d articles from 'world' category.", len(world_article_urls))
 
-        # Convert the dictionary to a DataFrame
-        self.data = pd.DataFrame.from_dict(articles_details, orient='index')
\ No newline at end of file
+        # Convert the columns to a DataFrame
+        columns = {column: [] for column in COLUMNS}
+        for url, details in zip(world_article_urls, articles_details):
+            self.__append_row(columns, url, "world", details)
+        self.data = pd.DataFrame(columns, columns=COLUMNS)
\ No newline at end of file